@@ -7,15 +7,18 @@ over the values in the ``__all__`` variable exposed by the testinfra.modules
 namespace.
 """
 
+import functools
 import inspect
 import logging
 import operator
 import re
+import threading
 import types
 
 from salt.utils.stringutils import camel_to_snake_case, snake_to_camel_case
 
 log = logging.getLogger(__name__)
+_DEBUG = logging.DEBUG
 
 try:
     import testinfra
@@ -25,7 +28,20 @@ try:
 except ImportError:
     TESTINFRA_PRESENT = False
 
-__all__ = []
+if TESTINFRA_PRESENT:
+    try:
+        _CAMEL_BY_SNAKE = {
+            camel_to_snake_case(module_): module_ for module_ in modules.__all__
+        }
+    except AttributeError:
+        _CAMEL_BY_SNAKE = {
+            module_: snake_to_camel_case(module_, uppercamel=True)
+            for module_ in modules.modules
+        }
+else:
+    _CAMEL_BY_SNAKE = {}
+
+__all__ = tuple(_CAMEL_BY_SNAKE)
 
 
 __virtualname__ = "testinfra"
@@ -36,12 +52,68 @@ class InvalidArgumentError(Exception):
     pass
 
 
+_COMPARISONS = {
+    comparison: getattr(operator, comparison)
+    for comparison in (
+        "eq",
+        "ne",
+        "lt",
+        "le",
+        "gt",
+        "ge",
+        "is_",
+        "is_not",
+        "contains",
+        "truth",
+    )
+}
+_COMPARISONS["search"] = re.search
+
+
 def __virtual__():
     if TESTINFRA_PRESENT:
         return __virtualname__
     return False, "The Testinfra package is not available"
 
 
+_MISSING = object()
+_CALLABLE_TYPES = (types.MethodType, types.FunctionType)
+
+_param_cache = {}
+
+
+_BACKEND_POOL = {}
+_BACKEND_POOL_LOCK = threading.Lock()
+
+
+def _get_backend(backend):
+    """Return the pooled backend instance for the given backend string so
+    that every module lookup in the process shares one backend object.
+
+    :param backend: string representing backend for TestInfra
+    :returns: TestInfra backend instance
+    :rtype: object
+
+    """
+    try:
+        return _BACKEND_POOL[backend]
+    except KeyError:
+        with _BACKEND_POOL_LOCK:
+            if backend not in _BACKEND_POOL:
+                _BACKEND_POOL[backend] = testinfra.get_backend(backend)
+            return _BACKEND_POOL[backend]
+
+
+def _reset_backend_pool():
+    """Discard all pooled backend instances along with the module classes
+    resolved through them.
+    """
+    with _BACKEND_POOL_LOCK:
+        _BACKEND_POOL.clear()
+        _get_module.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
 def _get_module(module_name, backend=default_backend):
     """Retrieve the correct module implementation determined by the backend
     being used.
@@ -52,10 +124,7 @@ def _get_module(module_name, backend=default_backend):
     :rtype: object
 
     """
-    backend_instance = testinfra.get_backend(backend)
-    return backend_instance.get_module(
-        snake_to_camel_case(module_name, uppercamel=True)
-    )
+    return _get_backend(backend).get_module(_CAMEL_BY_SNAKE[module_name])
 
 
 def _get_method_result(module_, module_instance, method_name, method_arg=None):
@@ -71,44 +140,50 @@ def _get_method_result(module_, module_instance, method_name, method_arg=None):
     :rtype: variable
 
     """
-    log.debug("Trying to call %s on %s", method_name, module_)
-    try:
-        method_obj = getattr(module_, method_name)
-    except AttributeError:
-        try:
-            method_obj = getattr(module_instance, method_name)
-        except AttributeError:
+    if log.isEnabledFor(_DEBUG):
+        log.debug("Trying to call %s on %s", method_name, module_)
+    method_obj = getattr(module_, method_name, _MISSING)
+    if method_obj is _MISSING:
+        method_obj = getattr(module_instance, method_name, _MISSING)
+        if method_obj is _MISSING:
             raise InvalidArgumentError(
-                "The {} module does not have any property or method named {}".format(
-                    module_, method_name
-                )
+                f"The {module_} module does not have any property or method "
+                f"named {method_name}"
             )
-    if isinstance(method_obj, property):
-        return method_obj.fget(module_instance)
-    elif isinstance(method_obj, (types.MethodType, types.FunctionType)):
+    if isinstance(method_obj, _CALLABLE_TYPES):
         if not method_arg:
             raise InvalidArgumentError(
-                "{} is a method of the {} module. An argument dict is required.".format(
-                    method_name, module_
-                )
-            )
-        try:
-            return getattr(module_instance, method_name)(method_arg["parameter"])
-        except KeyError:
-            raise InvalidArgumentError(
-                'The argument dict supplied has no key named "parameter": {}'.format(
-                    method_arg
-                )
+                f"{method_name} is a method of the {module_} module. An "
+                "argument dict is required."
             )
-        except AttributeError:
+        param = method_arg.get("parameter", _MISSING)
+        if param is _MISSING:
             raise InvalidArgumentError(
-                "The {} module does not have any property or method named {}".format(
-                    module_, method_name
-                )
+                f'The argument dict supplied has no key named "parameter": {method_arg}'
             )
-    else:
-        return method_obj
-    return None
+        if not isinstance(method_obj, types.MethodType):
+            # Resolved from the class, so bind it to the instance first.
+            method_obj = getattr(module_instance, method_name)
+        return method_obj(param)
+    elif isinstance(method_obj, property):
+        return method_obj.fget(module_instance)
+    return method_obj
+
+
+def _assert_bool(expected, result):
+    return result is expected
+
+
+def _assert_dict(expected, result):
+    comparison = _COMPARISONS.get(expected.get("comparison"))
+    if comparison is None:
+        raise InvalidArgumentError(
+            f"Comparison {expected.get('comparison')} is not a valid selection."
+        )
+    return comparison(expected["expected"], result)
+
+
+_ASSERTION_DISPATCH = {bool: _assert_bool, dict: _assert_dict}
 
 
 def _apply_assertion(expected, result):
@@ -126,31 +201,17 @@ def _apply_assertion(expected, result):
     :rtype: bool
 
     """
-    log.debug("Expected result: %s. Actual result: %s", expected, result)
-    if isinstance(expected, bool):
-        return result is expected
-    elif isinstance(expected, dict):
-        try:
-            comparison = getattr(operator, expected["comparison"])
-        except AttributeError:
-            if expected.get("comparison") == "search":
-                comparison = re.search
-            else:
-                raise InvalidArgumentError(
-                    "Comparison {} is not a valid selection.".format(
-                        expected.get("comparison")
-                    )
-                )
-        except KeyError:
-            log.exception(
-                "The comparison dictionary provided is missing "
-                'expected keys. Either "expected" or "comparison" '
-                "are not present."
-            )
-            raise
-        return comparison(expected["expected"], result)
-    else:
-        raise TypeError(f"Expected bool or dict but received {type(expected)}")
+    if log.isEnabledFor(_DEBUG):
+        log.debug("Expected result: %s. Actual result: %s", expected, result)
+    handler = _ASSERTION_DISPATCH.get(type(expected))
+    if handler is None:
+        # Subclasses (e.g. OrderedDict from rendered state data) miss the
+        # exact-type probe; resolve them once and cache the handler.
+        if isinstance(expected, dict):
+            handler = _ASSERTION_DISPATCH[type(expected)] = _assert_dict
+        else:
+            raise TypeError(f"Expected bool or dict but received {type(expected)}")
+    return handler(expected, result)
 
 
 # This does not currently generate documentation from the underlying modules
@@ -205,10 +266,13 @@ def _copy_function(module_name, name=None):
         success = True
         pass_msgs = []
         fail_msgs = []
+        _debug = log.isEnabledFor(_DEBUG)
         try:
-            log.debug("Retrieving %s module.", module_name)
+            if _debug:
+                log.debug("Retrieving %s module.", module_name)
             mod = _get_module(module_name)
-            log.debug("Retrieved module is %s", mod.__dict__)
+            if _debug:
+                log.debug("Retrieved module is %s", mod.__name__)
         except NotImplementedError:
             log.exception(
                 "The %s module is not supported for this backend and/or platform.",
@@ -216,19 +280,14 @@ def _copy_function(module_name, name=None):
             )
             success = False
             return success, pass_msgs, fail_msgs
-        if hasattr(inspect, "signature"):
-            mod_sig = inspect.signature(mod)
-            parameters = mod_sig.parameters
-        else:
-            if isinstance(mod.__init__, types.MethodType):
-                mod_sig = __utils__["args.get_function_argspec"](mod.__init__)
-            elif hasattr(mod, "__call__"):
-                mod_sig = __utils__["args.get_function_argspec"](mod.__call__)
-            parameters = mod_sig.args
-        log.debug("Parameters accepted by module %s: %s", module_name, parameters)
-        additional_args = {}
-        for arg in set(parameters).intersection(set(methods)):
-            additional_args[arg] = methods.pop(arg)
+        parameters = _param_cache.get(mod)
+        if parameters is None:
+            parameters = _param_cache[mod] = frozenset(
+                inspect.signature(mod).parameters
+            )
+        if _debug:
+            log.debug("Parameters accepted by module %s: %s", module_name, parameters)
+        additional_args = {arg: methods.pop(arg) for arg in parameters & methods.keys()}
         try:
             if len(parameters) > 1:
                 modinstance = mod(name, **additional_args)
@@ -237,61 +296,50 @@ def _copy_function(module_name, name=None):
         except TypeError:
             log.exception("Module failed to instantiate")
             raise
-        valid_methods = {}
-        log.debug("Called methods are: %s", methods)
-        for meth_name in methods:
-            if not meth_name.startswith("_"):
-                valid_methods[meth_name] = methods[meth_name]
-        log.debug("Valid methods are: %s", valid_methods)
+        if _debug:
+            log.debug("Called methods are: %s", methods)
+        valid_methods = {k: v for k, v in methods.items() if k[:1] != "_"}
+        if _debug:
+            log.debug("Valid methods are: %s", valid_methods)
+        # Bind the dispatch helpers to locals so the assertion loop pays
+        # LOAD_FAST instead of a global lookup per iteration.
+        get_method_result = _get_method_result
+        apply_assertion = _apply_assertion
         for meth, arg in valid_methods.items():
-            result = _get_method_result(mod, modinstance, meth, arg)
-            assertion_result = _apply_assertion(arg, result)
+            result = get_method_result(mod, modinstance, meth, arg)
+            assertion_result = apply_assertion(arg, result)
             if not assertion_result:
                 success = False
                 fail_msgs.append(
-                    "Assertion failed: {modname} {n} {m} {a}. "
-                    "Actual result: {r}".format(
-                        modname=module_name, n=name, m=meth, a=arg, r=result
-                    )
+                    f"Assertion failed: {module_name} {name} {meth} {arg}. "
+                    f"Actual result: {result}"
                 )
             else:
                 pass_msgs.append(
-                    "Assertion passed:  {modname} {n} {m} {a}. "
-                    "Actual result: {r}".format(
-                        modname=module_name, n=name, m=meth, a=arg, r=result
-                    )
+                    f"Assertion passed:  {module_name} {name} {meth} {arg}. "
+                    f"Actual result: {result}"
                 )
         return success, pass_msgs, fail_msgs
 
-    func = _run_tests
     if name is not None:
-        # types.FunctionType requires a str for __name__ attribute, using a
-        # unicode type will result in a TypeError.
         name = str(name)
     else:
-        name = func.__name__
-    return types.FunctionType(
-        func.__code__, func.__globals__, name, func.__defaults__, func.__closure__
-    )
+        name = _run_tests.__name__
+    _run_tests.__name__ = name
+    _run_tests.__qualname__ = name
+    return _run_tests
 
 
-def _register_functions():
+def __getattr__(name):
     """
-    Iterate through the exposed Testinfra modules, convert them to salt
-    functions, and then register them in the module namespace so that they
-    can be called via salt.
+    Convert the exposed Testinfra modules to salt functions on first access
+    (PEP 562) and register them in the module namespace so that they can be
+    called via salt. Building the wrappers lazily avoids generating every
+    wrapper at import time when a run typically touches only a few of them.
     """
-    try:
-        modules_ = [camel_to_snake_case(module_) for module_ in modules.__all__]
-    except AttributeError:
-        modules_ = [module_ for module_ in modules.modules]
-
-    for mod_name in modules_:
-        mod_func = _copy_function(mod_name, mod_name)
-        mod_func.__doc__ = _build_doc(mod_name)
-        __all__.append(mod_name)
-        globals()[mod_name] = mod_func
-
-
-if TESTINFRA_PRESENT:
-    _register_functions()
+    if name in _CAMEL_BY_SNAKE:
+        mod_func = _copy_function(name, name)
+        mod_func.__doc__ = _build_doc(name)
+        globals()[name] = mod_func
+        return mod_func
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")